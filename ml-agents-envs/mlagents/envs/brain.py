@@ -136,14 +136,12 @@ class BrainInfo:
                         0 if agent_info.action_mask[k] else 1
                         for k in range(total_num_actions)
                     ]
-        if any([np.isnan(x.reward) for x in agent_info_list]):
+        rewards = [x.reward for x in agent_info_list]
+        reward_nans = np.isnan(rewards)
+        if reward_nans.any():
             logger.warning(
                 "An agent had a NaN reward for brain " + brain_params.brain_name
             )
-        if any([np.isnan(x.stacked_vector_observation).any() for x in agent_info_list]):
-            logger.warning(
-                "An agent had a NaN observation for brain " + brain_params.brain_name
-            )
 
         if len(agent_info_list) == 0:
             vector_obs = np.zeros(
@@ -154,15 +152,22 @@ class BrainInfo:
                 )
             )
         else:
-            vector_obs = np.nan_to_num(
-                np.array([x.stacked_vector_observation for x in agent_info_list])
+            # Check for NaNs on the stacked array rather than once per agent.
+            vector_obs = np.array(
+                [x.stacked_vector_observation for x in agent_info_list]
             )
+            if np.isnan(vector_obs).any():
+                logger.warning(
+                    "An agent had a NaN observation for brain "
+                    + brain_params.brain_name
+                )
+            vector_obs = np.nan_to_num(vector_obs)
         brain_info = BrainInfo(
             visual_observation=vis_obs,
             vector_observation=vector_obs,
             text_observations=[x.text_observation for x in agent_info_list],
             memory=memory,
-            reward=[x.reward if not np.isnan(x.reward) else 0 for x in agent_info_list],
+            reward=[0 if is_nan else r for r, is_nan in zip(rewards, reward_nans)],
             agents=[x.id for x in agent_info_list],
             local_done=[x.done for x in agent_info_list],
             vector_action=np.array([x.stored_vector_actions for x in agent_info_list]),
@@ -459,18 +459,15 @@ class UnityEnvironment(BaseUnityEnvironment):
 
             for brain_name in self._external_brain_names:
                 n_agent = self._n_agents[brain_name]
+                brain = self._brains[brain_name]
                 if brain_name not in vector_action:
-                    if self._brains[brain_name].vector_action_space_type == "discrete":
+                    if brain.vector_action_space_type == "discrete":
                         vector_action[brain_name] = (
-                            [0.0]
-                            * n_agent
-                            * len(self._brains[brain_name].vector_action_space_size)
+                            [0.0] * n_agent * len(brain.vector_action_space_size)
                         )
                     else:
                         vector_action[brain_name] = (
-                            [0.0]
-                            * n_agent
-                            * self._brains[brain_name].vector_action_space_size[0]
+                            [0.0] * n_agent * brain.vector_action_space_size[0]
                         )
                 else:
                     vector_action[brain_name] = self._flatten(vector_action[brain_name])
@@ -508,21 +505,13 @@ class UnityEnvironment(BaseUnityEnvironment):
                         )
                     )
 
-                discrete_check = (
-                    self._brains[brain_name].vector_action_space_type == "discrete"
-                )
+                discrete_check = brain.vector_action_space_type == "discrete"
 
-                expected_discrete_size = n_agent * len(
-                    self._brains[brain_name].vector_action_space_size
-                )
+                expected_discrete_size = n_agent * len(brain.vector_action_space_size)
 
-                continuous_check = (
-                    self._brains[brain_name].vector_action_space_type == "continuous"
-                )
+                continuous_check = brain.vector_action_space_type == "continuous"
 
-                expected_continuous_size = (
-                    self._brains[brain_name].vector_action_space_size[0] * n_agent
-                )
+                expected_continuous_size = brain.vector_action_space_size[0] * n_agent
 
                 if not (
                     (
@@ -542,7 +531,7 @@ class UnityEnvironment(BaseUnityEnvironment):
                             str(expected_discrete_size)
                             if discrete_check
                             else str(expected_continuous_size),
-                            self._brains[brain_name].vector_action_space_type,
+                            brain.vector_action_space_type,
                             str(vector_action[brain_name]),
                         )
                     )
@@ -566,7 +555,7 @@ class UnityEnvironment(BaseUnityEnvironment):
             raise UnityActionException(
                 "The episode is completed. Reset the environment with 'reset()'"
             )
-        elif self.global_done is None:
+        elif self._global_done is None:
             raise UnityActionException(
                 "You cannot conduct step without first calling reset. "
                 "Reset the environment with 'reset()'"
@@ -625,12 +614,15 @@ class UnityEnvironment(BaseUnityEnvironment):
         self, vector_action, memory, text_action, value, custom_action
     ) -> UnityRLInput:
         rl_in = UnityRLInput()
+        rl_in.command = 0
         for b in vector_action:
             n_agents = self._n_agents[b]
             if n_agents == 0:
                 continue
             _a_s = len(vector_action[b]) // n_agents
             _m_s = len(memory[b]) // n_agents
+            brain_value = value.get(b)
+            agent_actions = rl_in.agent_actions[b].value
             for i in range(n_agents):
                 action = AgentActionProto(
                     vector_actions=vector_action[b][i * _a_s : (i + 1) * _a_s],
@@ -638,11 +630,9 @@ class UnityEnvironment(BaseUnityEnvironment):
                     text_actions=text_action[b][i],
                     custom_action=custom_action[b][i],
                 )
-                if b in value:
-                    if value[b] is not None:
-                        action.value = float(value[b][i])
-                rl_in.agent_actions[b].value.extend([action])
-                rl_in.command = 0
+                if brain_value is not None:
+                    action.value = float(brain_value[i])
+                agent_actions.extend([action])
         return self.wrap_unity_input(rl_in)
 
     def _generate_reset_input(
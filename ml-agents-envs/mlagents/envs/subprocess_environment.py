@@ -155,8 +155,7 @@ class SubprocessUnityEnvironment(BaseUnityEnvironment):
                 "Tried to await an environment step, but no async step was taken."
             )
 
-        steps = [self.envs[i].recv() for i in range(len(self.envs))]
-        self._get_agent_counts(map(lambda s: s.payload, steps))
+        steps = [env.recv() for env in self.envs]
         combined_brain_info = self._merge_step_info(steps)
         self.waiting = False
         return combined_brain_info
@@ -169,9 +168,7 @@ class SubprocessUnityEnvironment(BaseUnityEnvironment):
 
     def reset(self, config=None, train_mode=True) -> AllBrainInfo:
         self._broadcast_message("reset", (config, train_mode))
-        reset_results = [self.envs[i].recv() for i in range(len(self.envs))]
-        self._get_agent_counts(map(lambda r: r.payload, reset_results))
-
+        reset_results = [env.recv() for env in self.envs]
         return self._merge_step_info(reset_results)
 
     @property
@@ -196,19 +193,15 @@ class SubprocessUnityEnvironment(BaseUnityEnvironment):
         for env in self.envs:
             env.close()
 
-    def _get_agent_counts(self, step_list: Iterable[AllBrainInfo]):
-        for i, step in enumerate(step_list):
-            for brain_name, brain_info in step.items():
-                if brain_name not in self.env_agent_counts.keys():
-                    self.env_agent_counts[brain_name] = [0] * len(self.envs)
-                self.env_agent_counts[brain_name][i] = len(brain_info.agents)
-
-    @staticmethod
-    def _merge_step_info(env_steps: List[EnvironmentResponse]) -> AllBrainInfo:
+    def _merge_step_info(self, env_steps: List[EnvironmentResponse]) -> AllBrainInfo:
         accumulated_brain_info: AllBrainInfo = None
-        for env_step in env_steps:
+        for env_index, env_step in enumerate(env_steps):
             all_brain_info: AllBrainInfo = env_step.payload
             for brain_name, brain_info in all_brain_info.items():
+                # Record agent counts so step_async can split the next actions.
+                if brain_name not in self.env_agent_counts:
+                    self.env_agent_counts[brain_name] = [0] * len(self.envs)
+                self.env_agent_counts[brain_name][env_index] = len(brain_info.agents)
                 for i in range(len(brain_info.agents)):
                     brain_info.agents[i] = (
                         str(env_step.worker_id) + "-" + str(brain_info.agents[i])
@@ -95,6 +95,31 @@ class SubprocessEnvironmentTest(unittest.TestCase):
         )
         self.assertEqual(combined_braininfo.agents, ["0-1", "0-2", "1-3"])
 
+    def test_reset_records_agent_counts(self):
+        all_brain_info_env0 = {
+            "MockBrain": BrainInfo(
+                [], [[1.0, 2.0]], [], agents=[1], memory=np.zeros((0, 0))
+            )
+        }
+        all_brain_info_env1 = {
+            "MockBrain": BrainInfo(
+                [], [[3.0, 4.0], [3.0, 4.0]], [], agents=[2, 3], memory=np.zeros((0, 0))
+            )
+        }
+        env_worker_0 = MockEnvWorker(0)
+        env_worker_0.recv.return_value = EnvironmentResponse(
+            "reset", 0, all_brain_info_env0
+        )
+        env_worker_1 = MockEnvWorker(1)
+        env_worker_1.recv.return_value = EnvironmentResponse(
+            "reset", 1, all_brain_info_env1
+        )
+        env = SubprocessUnityEnvironment(mock_env_factory, 0)
+        env.envs = [env_worker_0, env_worker_1]
+        combined_braininfo = env.reset()["MockBrain"]
+        self.assertEqual(env.env_agent_counts, {"MockBrain": [1, 2]})
+        self.assertEqual(combined_braininfo.agents, ["0-1", "1-2", "1-3"])
+
     def test_step_resets_on_global_done(self):
         env_mock = Mock()
         env_mock.reset = Mock(return_value="reset_data")
@@ -523,7 +523,7 @@ class BarracudaWriter:
     def write_shape(self, s):
         self.write_int32(len(s))
         for el in s:
-            self.write_int32(el if el != None else -1)
+            self.write_int32(el if el is not None else -1)
 
     def close(self):
         self.f.close()
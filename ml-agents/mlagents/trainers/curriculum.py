@@ -62,6 +62,11 @@ class Curriculum(object):
                         key, location, self.max_lesson_num + 1, len(parameters[key])
                     )
                 )
+        # Lesson parameters are fixed, so the config of every lesson is built once.
+        self._lesson_configs = [
+            {key: parameters[key][lesson] for key in parameters}
+            for lesson in range(self.max_lesson_num + 1)
+        ]
 
     @property
     def lesson_num(self):
@@ -86,10 +91,7 @@ class Curriculum(object):
         if self.lesson_num < self.max_lesson_num:
             if measure_val > self.data["thresholds"][self.lesson_num]:
                 self.lesson_num += 1
-                config = {}
-                parameters = self.data["parameters"]
-                for key in parameters:
-                    config[key] = parameters[key][self.lesson_num]
+                config = self._lesson_configs[self.lesson_num]
                 logger.info(
                     "{0} lesson changed. Now in lesson {1}: {2}".format(
                         self._brain_name,
@@ -112,8 +114,4 @@ class Curriculum(object):
         if lesson is None:
             lesson = self.lesson_num
         lesson = max(0, min(lesson, self.max_lesson_num))
-        config = {}
-        parameters = self.data["parameters"]
-        for key in parameters:
-            config[key] = parameters[key][lesson]
-        return config
+        return dict(self._lesson_configs[lesson])
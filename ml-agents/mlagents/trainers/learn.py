@@ -195,7 +195,7 @@ def create_environment_factory(
         # Navigate in docker path and find env_path and copy it.
         env_path = prepare_for_docker_run(docker_target_name, env_path)
     seed_count = 10000
-    seed_pool = [np.random.randint(0, seed_count) for _ in range(seed_count)]
+    seed_pool = np.random.randint(0, seed_count, size=seed_count).tolist()
 
     def create_unity_environment(worker_id: int) -> UnityEnvironment:
         env_seed = seed
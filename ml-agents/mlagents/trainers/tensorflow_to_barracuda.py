@@ -1198,7 +1198,7 @@ def process_layer(layer, context, args):
                 -1 not in input_ranks
             )  # for rank() lambda all input ranks have to be known (not -1)
             rank = rank(input_ranks)
-    if rank == None:
+    if rank is None:
 
         def all_elements_equal(arr):  # http://stackoverflow.com/q/3844948/
             return arr.count(arr[0]) == len(arr)
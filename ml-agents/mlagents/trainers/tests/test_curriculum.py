@@ -94,3 +94,11 @@ def test_get_config(mock_file):
     curriculum.lesson_num = 2
     assert curriculum.get_config() == {"param1": 0.3, "param2": 20, "param3": 0.7}
     assert curriculum.get_config(0) == {"param1": 0.7, "param2": 100, "param3": 0.2}
+
+
+@patch("builtins.open", new_callable=mock_open, read_data=dummy_curriculum_json_str)
+def test_get_config_returns_copy(mock_file):
+    curriculum = Curriculum("TestBrain.json", {"param1": 1, "param2": 1, "param3": 1})
+    config = curriculum.get_config()
+    config["param1"] = 42
+    assert curriculum.get_config() == {"param1": 0.7, "param2": 100, "param3": 0.2}
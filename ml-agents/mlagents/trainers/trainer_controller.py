@@ -148,7 +148,8 @@ class TrainerController(object):
                     trainer_parameters[k] = trainer_config[_brain_key][k]
             trainer_parameters_dict[brain_name] = trainer_parameters.copy()
         for brain_name in self.external_brains:
-            if trainer_parameters_dict[brain_name]["trainer"] == "offline_bc":
+            trainer_type = trainer_parameters_dict[brain_name]["trainer"]
+            if trainer_type == "offline_bc":
                 self.trainers[brain_name] = OfflineBCTrainer(
                     self.external_brains[brain_name],
                     trainer_parameters_dict[brain_name],
@@ -157,7 +158,7 @@ class TrainerController(object):
                     self.seed,
                     self.run_id,
                 )
-            elif trainer_parameters_dict[brain_name]["trainer"] == "online_bc":
+            elif trainer_type == "online_bc":
                 self.trainers[brain_name] = OnlineBCTrainer(
                     self.external_brains[brain_name],
                     trainer_parameters_dict[brain_name],
@@ -166,7 +167,7 @@ class TrainerController(object):
                     self.seed,
                     self.run_id,
                 )
-            elif trainer_parameters_dict[brain_name]["trainer"] == "ppo":
+            elif trainer_type == "ppo":
                 self.trainers[brain_name] = PPOTrainer(
                     self.external_brains[brain_name],
                     self.meta_curriculum.brains_to_curriculums[
@@ -238,7 +239,7 @@ class TrainerController(object):
         try:
             curr_info = self._reset_env(env)
             while (
-                any([t.get_step <= t.get_max_steps for k, t in self.trainers.items()])
+                any(t.get_step <= t.get_max_steps for t in self.trainers.values())
                 or not self.train_model
             ):
                 new_info = self.take_step(env, curr_info)